@@ -13,8 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass, field, is_dataclass, asdict, MISSING
+from dataclasses import dataclass, field, fields, is_dataclass, asdict, MISSING
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Union, Optional, List
 import os
 import json
@@ -22,16 +23,22 @@ import hashlib
 import torch
 from cosmos_reason1.utils.util import update_dataclass_with_dict
 
+_PARAM_TORCH_DTYPES = {
+    "bfloat16": torch.bfloat16,
+    "float16": torch.float16,
+    "float32": torch.float32,
+}
+_FSDP_REDUCE_TORCH_DTYPES = {"float32": torch.float32}
+_GRPO_POLICY_KEYS = frozenset(["temperature", "epsilon_low", "epsilon_high", "kl_beta"])
+
 
 def skip_ui_field(*, default=MISSING, default_factory=MISSING, **kwargs):
-    metadata = kwargs.pop("metadata", {})
-    metadata["skip_ui"] = True
-    if default_factory is not MISSING:
-        return field(default_factory=default_factory, metadata=metadata, **kwargs)
-    elif default is not MISSING:
-        return field(default=default, metadata=metadata, **kwargs)
-    else:
+    if default is MISSING and default_factory is MISSING:
         raise ValueError("Must provide either default or default_factory.")
+    metadata = {**kwargs.pop("metadata", {}), "skip_ui": True}
+    return field(
+        default=default, default_factory=default_factory, metadata=metadata, **kwargs
+    )
 
 
 def config_hash(config) -> str:
@@ -39,7 +46,10 @@ def config_hash(config) -> str:
     Compute the hash of a config object
     """
     if is_dataclass(config):
-        return hashlib.md5(json.dumps(asdict(config)).encode()).hexdigest()
+        # Identity-only hash, keep md5 so existing cache folders stay valid
+        return hashlib.md5(
+            json.dumps(asdict(config)).encode(), usedforsecurity=False
+        ).hexdigest()
     else:
         return "unhashable"
 
@@ -209,7 +219,7 @@ class CheckpointConfig:
     )
 
     def __post_init__(self):
-        if self.save_mode not in ["async", "sync"]:
+        if self.save_mode not in {"async", "sync"}:
             raise ValueError(
                 f"Invalid save_mode: {self.save_mode}. Must be one of ['async', 'sync']"
             )
@@ -390,10 +400,10 @@ class GrpoConfig:
     )
 
     def __post_init__(self):
-        assert self.variant in [
+        assert self.variant in {
             "grpo",
             "dapo",
-        ], "variant must be one of ['grpo', 'dapo']"
+        }, "variant must be one of ['grpo', 'dapo']"
         if self.dataloader_num_workers <= 0:
             self.dataloader_prefetch_factor = None
             self.dataloader_num_workers = 0
@@ -525,19 +535,15 @@ class TrainingConfig:
             )
 
     def key_values(self):
-        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     @property
     def param_torch_dtype(self):
-        return {
-            "bfloat16": torch.bfloat16,
-            "float16": torch.float16,
-            "float32": torch.float32,
-        }[self.param_dtype]
+        return _PARAM_TORCH_DTYPES[self.param_dtype]
 
     @property
     def fsdp_reduce_torch_dtype(self):
-        return {"float32": torch.float32}[self.fsdp_reduce_dtype]
+        return _FSDP_REDUCE_TORCH_DTYPES[self.fsdp_reduce_dtype]
 
 
 @dataclass
@@ -573,18 +579,18 @@ class ParallelismConfig:
         },
     )
 
-    @property
+    @cached_property
     def world_size(self):
         world_size = os.environ.get("WORLD_SIZE", 1)
         return int(world_size)
 
-    @property
+    @cached_property
     def local_world_size(self):
         local_world_size = os.environ.get("LOCAL_WORLD_SIZE", 1)
         return int(local_world_size)
 
     def key_values(self):
-        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 @dataclass
@@ -608,7 +614,7 @@ class PolicyConfig:
     )
 
     def key_values(self):
-        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 @dataclass
@@ -695,7 +701,7 @@ class RolloutConfig:
             self.parallelism = RolloutParallelismConfig(**self.parallelism)
 
     def key_values(self):
-        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 @dataclass
@@ -745,7 +751,7 @@ class Config:
     )
 
     def key_values(self):
-        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     @classmethod
     def from_dict(cls, config_data: dict[str, Any]) -> "Config":
@@ -770,10 +776,7 @@ class Config:
                 train_policy_data = config_data["train"]["train_policy"]
 
                 # Determine the type based on characteristic fields
-                if any(
-                    key in train_policy_data
-                    for key in ["temperature", "epsilon_low", "epsilon_high", "kl_beta"]
-                ):
+                if not _GRPO_POLICY_KEYS.isdisjoint(train_policy_data):
                     config.train.train_policy = GrpoConfig()
                 else:
                     config.train.train_policy = SFTDataConfig()
@@ -783,28 +786,30 @@ class Config:
         return config
 
     def validate(self):
+        parallelism = self.policy.parallelism
+        train_policy = self.train.train_policy
         assert (
             self.policy.model_name_or_path is not None
             and self.policy.model_name_or_path != ""
         ), "model_name_or_path is required"
-        assert self.policy.parallelism.tp_size > 0, "tp_size must be greater than 0"
-        assert self.policy.parallelism.cp_size > 0, "cp_size must be greater than 0"
-        assert self.policy.parallelism.pp_size > 0, "pp_size must be greater than 0"
+        assert parallelism.tp_size > 0, "tp_size must be greater than 0"
+        assert parallelism.cp_size > 0, "cp_size must be greater than 0"
+        assert parallelism.pp_size > 0, "pp_size must be greater than 0"
         assert (
-            self.policy.parallelism.dp_shard_size >= -1
-            and self.policy.parallelism.dp_shard_size != 0
+            parallelism.dp_shard_size >= -1 and parallelism.dp_shard_size != 0
         ), "dp_shard_size must be greater than 0 or -1 to be auto-inferred"
         assert (
-            self.policy.parallelism.dp_replicate_size == 1
+            parallelism.dp_replicate_size == 1
         ), "dp_replicate_size must be 1 for dynamic scaling purpose"
-        if self.policy.parallelism.pp_size > 1:
+        if parallelism.pp_size > 1:
             assert (
-                self.policy.parallelism.pp_micro_batch_size > 0
+                parallelism.pp_micro_batch_size > 0
             ), "pp_micro_batch_size must be greater than 0"
+            n_micro_batches, remainder = divmod(
+                self.train.train_batch_per_replica, parallelism.pp_micro_batch_size
+            )
             assert (
-                self.train.train_batch_per_replica
-                % self.policy.parallelism.pp_micro_batch_size
-                == 0
+                remainder == 0
             ), "train_batch must be divisible by pp_micro_batch_size"
 
             # Here we assume that PP uses `Single-stage per rank` which is true for:
@@ -812,25 +817,16 @@ class Config:
             #   - 1F1B
             # But not correct for those `InterleavedXXX` style schedule
             assert (
-                (
-                    self.train.train_batch_per_replica
-                    // self.policy.parallelism.pp_micro_batch_size
-                )
-                % self.policy.parallelism.pp_size
-                == 0
+                n_micro_batches % parallelism.pp_size == 0
             ), "train_batch / pp_micro_batch_size must be divisible by pp_size"
-        if self.train.train_policy.type == "grpo":
-            if isinstance(self.train.train_policy.reward_function, str):
-                self.train.train_policy.reward_function = [
-                    self.train.train_policy.reward_function
-                ]
+        if train_policy.type == "grpo":
+            if isinstance(train_policy.reward_function, str):
+                train_policy.reward_function = [train_policy.reward_function]
             assert (
-                len(self.train.train_policy.reward_function) > 0
+                len(train_policy.reward_function) > 0
             ), "reward_function must be a list of reward functions"
-        if isinstance(self.train.train_policy.dataset_train_split, str):
-            self.train.train_policy.dataset_train_split = [
-                self.train.train_policy.dataset_train_split
-            ]
+        if isinstance(train_policy.dataset_train_split, str):
+            train_policy.dataset_train_split = [train_policy.dataset_train_split]
         if self.train.ckpt.upload_s3:
             if self.train.ckpt.upload_s3 not in ["final", "all"]:
                 raise ValueError(